@@ -5,23 +5,48 @@ from homeassistant.components.lock import CONF_DEFAULT_CODE, DOMAIN as LOCK_DOMA
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_CODE
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .const import COORDINATOR, DOMAIN, LOGGER, PLATFORMS
-from .coordinator import YaleDataUpdateCoordinator
+from .const import (
+    COORDINATOR,
+    DOMAIN,
+    HISTORY_COORDINATOR,
+    LOGGER,
+    PANEL_INFO,
+    PLATFORMS,
+)
+from .coordinator import YaleDataUpdateCoordinator, YaleHistoryCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Yale from a config entry."""
 
     coordinator = YaleDataUpdateCoordinator(hass, entry)
-    if not await hass.async_add_executor_job(coordinator.get_updates):
-        raise ConfigEntryAuthFailed
+    try:
+        if not await coordinator.async_get_updates():
+            raise ConfigEntryAuthFailed
+
+        await coordinator.async_config_entry_first_refresh()
+
+        try:
+            panel_info = await coordinator.async_get_panel_info()
+        except UpdateFailed as error:
+            raise ConfigEntryNotReady from error
+
+        history_coordinator: YaleHistoryCoordinator | None = None
+        if coordinator.data["smoke_sensors"]:
+            history_coordinator = YaleHistoryCoordinator(hass, coordinator)
+            await history_coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_close_client()
+        raise
 
-    await coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         COORDINATOR: coordinator,
+        PANEL_INFO: panel_info,
+        HISTORY_COORDINATOR: history_coordinator,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -39,7 +64,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     if await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: YaleDataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id
+        )[COORDINATOR]
+        await coordinator.async_close_client()
         return True
     return False
 
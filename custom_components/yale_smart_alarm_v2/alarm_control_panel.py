@@ -20,7 +20,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from .const import COORDINATOR, DOMAIN, STATE_MAP, YALE_ALL_ERRORS
+from .const import COORDINATOR, DOMAIN, PANEL_INFO, STATE_MAP, YALE_ALL_ERRORS
 from .coordinator import YaleDataUpdateCoordinator
 from .entity import YaleAlarmEntity
 
@@ -31,7 +31,12 @@ async def async_setup_entry(
     """Set up the alarm entry."""
 
     async_add_entities(
-        [YaleAlarmDevice(coordinator=hass.data[DOMAIN][entry.entry_id][COORDINATOR])]
+        [
+            YaleAlarmDevice(
+                coordinator=hass.data[DOMAIN][entry.entry_id][COORDINATOR],
+                panel_info=hass.data[DOMAIN][entry.entry_id][PANEL_INFO],
+            )
+        ]
     )
 
 
@@ -45,9 +50,11 @@ class YaleAlarmDevice(YaleAlarmEntity, AlarmControlPanelEntity):
     )
     _attr_name = None
 
-    def __init__(self, coordinator: YaleDataUpdateCoordinator) -> None:
+    def __init__(
+        self, coordinator: YaleDataUpdateCoordinator, panel_info: dict
+    ) -> None:
         """Initialize the Yale Alarm Device."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, panel_info)
         self._attr_unique_id = coordinator.entry.entry_id
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
@@ -11,8 +11,8 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import COORDINATOR, DOMAIN
-from .coordinator import YaleDataUpdateCoordinator
+from .const import COORDINATOR, DOMAIN, HISTORY_COORDINATOR, PANEL_INFO
+from .coordinator import YaleDataUpdateCoordinator, YaleHistoryCoordinator
 from .entity import YaleAlarmEntity, YaleEntity
 
 SENSOR_TYPES = (
@@ -51,13 +51,18 @@ async def async_setup_entry(
     coordinator: YaleDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         COORDINATOR
     ]
+    history_coordinator: YaleHistoryCoordinator | None = hass.data[DOMAIN][
+        entry.entry_id
+    ][HISTORY_COORDINATOR]
+    panel_info: dict = hass.data[DOMAIN][entry.entry_id][PANEL_INFO]
     sensors: list[YaleDoorSensor | YaleSmokeSensor | YaleProblemSensor] = []
     for data in coordinator.data["door_windows"]:
         sensors.append(YaleDoorSensor(coordinator, data))
-    for data in coordinator.data["smoke_sensors"]:
-        sensors.append(YaleSmokeSensor(coordinator, data))
+    if history_coordinator is not None:
+        for data in coordinator.data["smoke_sensors"]:
+            sensors.append(YaleSmokeSensor(history_coordinator, data))
     for description in SENSOR_TYPES:
-        sensors.append(YaleProblemSensor(coordinator, description))
+        sensors.append(YaleProblemSensor(coordinator, panel_info, description))
 
     async_add_entities(sensors)
 
@@ -67,10 +72,15 @@ class YaleDoorSensor(YaleEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.DOOR
 
+    def __init__(self, coordinator: YaleDataUpdateCoordinator, data: dict) -> None:
+        """Initialize the Yale door sensor."""
+        super().__init__(coordinator, data)
+        self._state_index = coordinator.state_index[self._attr_unique_id]
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        return bool(self.coordinator.data["door_sensor_map"][self._attr_unique_id] == "open")
+        return bool(self.coordinator.states[self._state_index] == "open")
 
 
 class YaleSmokeSensor(YaleEntity, BinarySensorEntity):
@@ -78,6 +88,8 @@ class YaleSmokeSensor(YaleEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.SMOKE
 
+    coordinator: YaleHistoryCoordinator
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -92,10 +104,11 @@ class YaleProblemSensor(YaleAlarmEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: YaleDataUpdateCoordinator,
+        panel_info: dict,
         entity_description: BinarySensorEntityDescription,
     ) -> None:
         """Initiate Yale Problem Sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, panel_info)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.entry.entry_id}-{entity_description.key}"
 
@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import COORDINATOR, DOMAIN
+from .const import COORDINATOR, DOMAIN, PANEL_INFO
 from .coordinator import YaleDataUpdateCoordinator
 from .entity import YaleAlarmEntity
 
@@ -31,9 +31,13 @@ async def async_setup_entry(
     coordinator: YaleDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         COORDINATOR
     ]
+    panel_info: dict = hass.data[DOMAIN][entry.entry_id][PANEL_INFO]
 
     async_add_entities(
-        [YalePanicButton(coordinator, description) for description in BUTTON_TYPES]
+        [
+            YalePanicButton(coordinator, panel_info, description)
+            for description in BUTTON_TYPES
+        ]
     )
 
 
@@ -45,10 +49,11 @@ class YalePanicButton(YaleAlarmEntity, ButtonEntity):
     def __init__(
         self,
         coordinator: YaleDataUpdateCoordinator,
+        panel_info: dict,
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the plug switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, panel_info)
         self.entity_description = description
         self._attr_unique_id = f"yale_smart_alarm-{description.key}"
 
@@ -0,0 +1,178 @@
+"""Yale Smart Alarm client reusing one HTTP session for all API calls."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+
+import aiohttp
+import requests
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    HTTPError,
+    RequestException,
+    Timeout,
+)
+from yalesmartalarmclient.auth import YaleAuth
+from yalesmartalarmclient.client import YaleSmartAlarmClient
+from yalesmartalarmclient.const import DEFAULT_REQUEST_TIMEOUT
+from yalesmartalarmclient.exceptions import UnknownError
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER, YALE_BASE_ERRORS
+
+# Polling endpoints, taken from the upstream client so they follow its releases.
+ENDPOINT_MODE = YaleSmartAlarmClient._ENDPOINT_GET_MODE
+ENDPOINT_CYCLE = YaleSmartAlarmClient._ENDPOINT_CYCLE
+ENDPOINT_STATUS = YaleSmartAlarmClient._ENDPOINT_STATUS
+ENDPOINT_ONLINE = YaleSmartAlarmClient._ENDPOINT_ONLINE
+ENDPOINT_HISTORY = YaleSmartAlarmClient._ENDPOINT_HISTORY
+ENDPOINT_CHECK = YaleSmartAlarmClient._ENDPOINT_CHECK
+ENDPOINT_PANEL_INFO = YaleSmartAlarmClient._ENDPOINT_PANEL_INFO
+
+# Retries of a failed read, as the Yale API fails transiently now and then.
+READ_RETRIES = 2
+READ_RETRY_DELAY = 5
+
+
+class YaleSessionAuth(YaleAuth):
+    """Yale authentication sending authenticated calls over a keep-alive session."""
+
+    session: requests.Session
+
+    @classmethod
+    def from_auth(cls, auth: YaleAuth) -> YaleSessionAuth:
+        """Return a session auth taking over the host and tokens of an authorized YaleAuth."""
+        session_auth = cls.__new__(cls)
+        session_auth.__dict__.update(auth.__dict__)
+        session_auth.session = requests.Session()
+        return session_auth
+
+    def _request(
+        self, method: str, url: str, reauthorize: bool = True, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request with the current token, re-authorizing once on 401/403."""
+        try:
+            response = self.session.request(
+                method,
+                url,
+                headers=self.auth_headers,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                **kwargs,
+            )
+            response.raise_for_status()
+        except HTTPError as error:
+            LOGGER.debug("Http Error: %s", error)
+            if reauthorize and response.status_code in [401, 403]:
+                self.reauthorize()
+                return self._request(method, url, reauthorize=False, **kwargs)
+            raise ConnectionError(f"Connection error {error}") from error
+        except RequestsConnectionError as error:
+            LOGGER.debug("Connection Error: %s", error)
+            raise ConnectionError(f"Connection error {error}") from error
+        except Timeout as error:
+            LOGGER.debug("Timeout Error: %s", error)
+            raise TimeoutError(f"Timeout {error}") from error
+        except RequestException as error:
+            LOGGER.debug("Requests Error: %s", error)
+            raise UnknownError(f"Requests error {error}") from error
+        return response
+
+    def reauthorize(self) -> None:
+        """Drop the current tokens and authorize again."""
+        self.refresh_token = None
+        self.access_token = None
+        self._authorize()
+
+    def get_authenticated(self, endpoint: str) -> dict[str, Any]:
+        """Execute a GET request on an endpoint."""
+        response = self._request("GET", self._host + endpoint)
+        return cast(dict[str, Any], response.json())
+
+    def post_authenticated(
+        self, endpoint: str, params: dict[Any, Any] | None = None
+    ) -> dict[str, Any]:
+        """Execute a POST request on an endpoint."""
+        if "panic" in endpoint:
+            url = self._host[:-5] + endpoint
+        else:
+            url = self._host + endpoint
+
+        response = self._request("POST", url, data=params)
+
+        if "panic" in endpoint:
+            return {"panic": "triggered"}
+        return cast(dict[str, Any], response.json())
+
+    def close(self) -> None:
+        """Close the underlying session."""
+        self.session.close()
+
+
+class YaleSessionClient(YaleSmartAlarmClient):
+    """Yale Smart Alarm client using YaleSessionAuth."""
+
+    def __init__(self, username: str, password: str, area_id: int = 1) -> None:
+        """Initialize the client and move it to a session backed authentication."""
+        super().__init__(username, password, area_id)
+        self.auth: YaleSessionAuth = YaleSessionAuth.from_auth(self.auth)
+        self.lock_api.auth = self.auth
+
+    def close(self) -> None:
+        """Close the underlying session."""
+        self.auth.close()
+
+
+class YaleAsyncReader:
+    """Read Yale polling endpoints with aiohttp, using the token of a YaleSessionAuth."""
+
+    def __init__(
+        self, hass: HomeAssistant, session: aiohttp.ClientSession, auth: YaleSessionAuth
+    ) -> None:
+        """Initialize the reader."""
+        self.hass = hass
+        self.session = session
+        self.auth = auth
+        self._reauthorize_lock = asyncio.Lock()
+
+    async def async_get(self, endpoint: str) -> Any:
+        """Return the data of a GET request on an endpoint, retrying transient errors."""
+        for attempt in range(READ_RETRIES):
+            try:
+                return await self._async_get(endpoint)
+            except YALE_BASE_ERRORS as error:
+                LOGGER.debug("Retry %d on path %s: %s", attempt + 1, endpoint, error)
+                await asyncio.sleep(READ_RETRY_DELAY)
+        return await self._async_get(endpoint)
+
+    async def _async_get(self, endpoint: str, reauthorize: bool = True) -> Any:
+        """Return the data of a GET request on an endpoint, re-authorizing once on 401/403."""
+        headers = self.auth.auth_headers
+        try:
+            async with self.session.get(
+                self.auth._host + endpoint,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            ) as response:
+                if reauthorize and response.status in [401, 403]:
+                    LOGGER.debug("Http Error: %s", response.status)
+                    async with self._reauthorize_lock:
+                        # Concurrent requests may have re-authorized already.
+                        if self.auth.auth_headers == headers:
+                            await self.hass.async_add_executor_job(self.auth.reauthorize)
+                    return await self._async_get(endpoint, reauthorize=False)
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+        except aiohttp.ClientResponseError as error:
+            LOGGER.debug("Http Error: %s", error)
+            raise ConnectionError(f"Connection error {error}") from error
+        except aiohttp.ClientConnectionError as error:
+            LOGGER.debug("Connection Error: %s", error)
+            raise ConnectionError(f"Connection error {error}") from error
+        except asyncio.TimeoutError as error:
+            LOGGER.debug("Timeout Error: %s", error)
+            raise TimeoutError(f"Timeout {error}") from error
+        except aiohttp.ClientError as error:
+            LOGGER.debug("Requests Error: %s", error)
+            raise UnknownError(f"Requests error {error}") from error
+        return data["data"]
@@ -1,5 +1,6 @@
 """Yale integration constants."""
 import logging
+import sys
 
 from yalesmartalarmclient.client import (
     YALE_STATE_ARM_FULL,
@@ -26,8 +27,12 @@ MODEL = "main"
 
 DOMAIN = "yale_smart_alarm_v2"
 COORDINATOR = "coordinator"
+PANEL_INFO = "panel_info"
+HISTORY_COORDINATOR = "history_coordinator"
 
 DEFAULT_SCAN_INTERVAL = 15
+MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 3600
 
 LOGGER = logging.getLogger(__package__)
 
@@ -57,3 +62,8 @@ YALE_ALL_ERRORS = (*YALE_BASE_ERRORS, AuthenticationError)
 
 YALE_EVENT_TYPE_SMOKE_ON = "1111"
 YALE_EVENT_TYPE_SMOKE_OFF = "3111"
+
+YALE_DEVICE_TYPE_DOOR_LOCK = sys.intern("device_type.door_lock")
+YALE_DEVICE_TYPE_DOOR_CONTACT = sys.intern("device_type.door_contact")
+YALE_DEVICE_TYPE_TEMPERATURE_SENSOR = sys.intern("device_type.temperature_sensor")
+YALE_DEVICE_TYPE_SMOKE_DETECTOR = sys.intern("device_type.smoke_detector")
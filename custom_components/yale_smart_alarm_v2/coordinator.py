@@ -1,27 +1,175 @@
 """DataUpdateCoordinator for the Yale integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
+import sys
 from typing import Any
 
-from yalesmartalarmclient.client import YaleSmartAlarmClient
 from yalesmartalarmclient.exceptions import AuthenticationError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .client import (
+    ENDPOINT_CHECK,
+    ENDPOINT_CYCLE,
+    ENDPOINT_HISTORY,
+    ENDPOINT_MODE,
+    ENDPOINT_ONLINE,
+    ENDPOINT_PANEL_INFO,
+    ENDPOINT_STATUS,
+    YaleAsyncReader,
+    YaleSessionClient,
+)
 from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
     YALE_BASE_ERRORS,
+    YALE_DEVICE_TYPE_DOOR_CONTACT,
+    YALE_DEVICE_TYPE_DOOR_LOCK,
+    YALE_DEVICE_TYPE_SMOKE_DETECTOR,
+    YALE_DEVICE_TYPE_TEMPERATURE_SENSOR,
     YALE_EVENT_TYPE_SMOKE_ON,
     YALE_EVENT_TYPE_SMOKE_OFF,
 )
 
+# How far back history events count towards a smoke detector state.
+_HIST_WINDOW = timedelta(minutes=3)
+
+
+def _to_seconds(timestamp: datetime) -> int:
+    """Return a naive datetime as whole seconds since 0001-01-01."""
+    return (
+        timestamp.toordinal() * 86400
+        + timestamp.hour * 3600
+        + timestamp.minute * 60
+        + timestamp.second
+    )
+
+
+# Maps (lock_status, has_lock, has_unlock, closed, locked) to (_state, _state2).
+_LOCK_STATE_TABLE: dict[tuple[bool, bool, bool, bool, bool], tuple[str, str | None]] = {
+    (False, True, False, False, False): ("locked", "unknown"),
+    (False, True, True, False, False): ("locked", "unknown"),
+    (False, False, True, False, False): ("unlocked", "unknown"),
+    **{
+        (True, has_lock, has_unlock, closed, locked): (
+            ("locked" if locked else "unlocked", "closed")
+            if closed
+            else ("unlocked", "open")
+        )
+        for has_lock, has_unlock in ((True, False), (False, True), (True, True))
+        for closed in (True, False)
+        for locked in (True, False)
+    },
+}
+
+# Parsed minigw_lock_status values, the set of distinct values reported is tiny.
+_HEX_CACHE: dict[Any, int] = {}
+
+
+def _parse_history_time(hist_time: str) -> datetime:
+    """Parse a history timestamp in the "%Y/%m/%d %H:%M:%S" format."""
+    return datetime(
+        int(hist_time[0:4]),
+        int(hist_time[5:7]),
+        int(hist_time[8:10]),
+        int(hist_time[11:13]),
+        int(hist_time[14:16]),
+        int(hist_time[17:19]),
+    )
+
+
+def _device_on_in_updates_history(
+    device: dict[str, Any],
+    hist_by_key: dict[tuple[str, str], list[dict[str, Any]]],
+    accepted_t: int,
+    enabled_type: str,
+    disabled_type: str,
+) -> bool:
+    """Return whether the latest recent history event of a device turned it on."""
+    exists = False
+    for hist_item in hist_by_key.get((device["type"], str(device["area"])), ()):
+        if hist_item["_t"] < accepted_t:
+            break
+        event_type = hist_item["event_type"]
+        if event_type == disabled_type:
+            break
+        if event_type == enabled_type:
+            exists = True
+            break
+    return exists
+
+
+def _handle_lock(device: dict[str, Any]) -> None:
+    """Set the state of a door lock."""
+    state = device["status1"]
+    lock_status_str = device["minigw_lock_status"]
+    lock_status = _HEX_CACHE.get(lock_status_str)
+    if lock_status is None:
+        lock_status = int(str(lock_status_str), 16) if lock_status_str else 0
+        _HEX_CACHE[lock_status_str] = lock_status
+    key = (
+        bool(lock_status),
+        "device_status.lock" in state,
+        "device_status.unlock" in state,
+        (lock_status & 16) == 16,
+        (lock_status & 1) == 1,
+    )
+    device["_state"], device["_state2"] = _LOCK_STATE_TABLE.get(
+        key, ("unavailable", None)
+    )
+
+
+def _handle_door_contact(device: dict[str, Any]) -> None:
+    """Set the state of a door contact."""
+    state = device["status1"]
+    if "device_status.dc_close" in state:
+        device["_state"] = "closed"
+    elif "device_status.dc_open" in state:
+        device["_state"] = "open"
+    else:
+        device["_state"] = "unavailable"
+
+
+def _handle_temperature(device: dict[str, Any]) -> None:
+    """Set the state of a temperature sensor."""
+    device["_state"] = float(device["status_temp"])
+
+
+# Maps device type to the data keys its devices and states are collected under
+# and its handler. Smoke detector states are set by YaleHistoryCoordinator.
+_DEVICE_HANDLERS: dict[
+    str, tuple[str, str | None, Callable[[dict[str, Any]], None] | None]
+] = {
+    YALE_DEVICE_TYPE_DOOR_LOCK: ("locks", "lock_map", _handle_lock),
+    YALE_DEVICE_TYPE_DOOR_CONTACT: ("door_windows", "door_sensor_map", _handle_door_contact),
+    YALE_DEVICE_TYPE_TEMPERATURE_SENSOR: ("temperature_sensors", "temperature_map", _handle_temperature),
+    YALE_DEVICE_TYPE_SMOKE_DETECTOR: ("smoke_sensors", None, None),
+}
+
+# Device keys set by the handlers in _DEVICE_HANDLERS.
+_STATE_KEYS = ("_state", "_state2")
+
+
+def _new_result() -> dict[str, Any]:
+    """Return an empty device coordinator result."""
+    result: dict[str, Any] = {"alarm": None, "status": None, "online": None}
+    for data_key, map_key, _ in _DEVICE_HANDLERS.values():
+        result[data_key] = []
+        if map_key is not None:
+            result[map_key] = {}
+    return result
+
 
 class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """A Yale Data Update Coordinator."""
@@ -29,177 +177,136 @@ class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the Yale hub."""
         self.entry = entry
-        self.yale: YaleSmartAlarmClient | None = None
+        self.yale: YaleSessionClient | None = None
+        self.api: YaleAsyncReader | None = None
+        self._last_result: dict[str, Any] | None = None
+        # Two result dicts used in turn, so the one being refilled is never the
+        # data the coordinator compares the new result against.
+        self._results = (_new_result(), _new_result())
+        # Handler inputs and resulting states of each device, keyed by address.
+        self._device_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        # Device states by a stable index per address, for cheap entity reads.
+        self.state_index: dict[str, int] = {}
+        self.states: list[Any] = []
+        scan_interval = int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        if not MIN_SCAN_INTERVAL <= scan_interval <= MAX_SCAN_INTERVAL:
+            LOGGER.warning(
+                "Update interval %s seconds is out of range, using %s to %s seconds",
+                scan_interval,
+                MIN_SCAN_INTERVAL,
+                MAX_SCAN_INTERVAL,
+            )
+            scan_interval = min(max(scan_interval, MIN_SCAN_INTERVAL), MAX_SCAN_INTERVAL)
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=scan_interval),
             always_update=False,
         )
 
-    def device_on_in_updates_history(self, device, updates, enabled_type, disabled_type, minutes=3):
-        update_timestamp = updates["update_timestamp"]
-        accepted_timestamp = update_timestamp - timedelta(minutes=minutes)
-        exists = False
-        for hist_item in updates["history"]:
-            hist_time = hist_item["time"]
-            hist_date = datetime.strptime(hist_time, "%Y/%m/%d %H:%M:%S")
-            if hist_date < accepted_timestamp:
-                break
-            if hist_item["type"] != device["type"]:
-                continue
-            if str(hist_item["area"]) != str(device["area"]):
-                continue
-            if str(hist_item["event_type"]) == disabled_type:
-                break
-            if str(hist_item["event_type"]) == enabled_type:
-                exists = True
-                break
-        return exists
-
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Yale."""
 
-        updates = await self.hass.async_add_executor_job(self.get_updates)
+        updates = await self.async_get_updates()
 
-        locks = []
-        door_windows = []
-        sensors_temperature = []
-        sensors_smoke = []
+        result = self._results[self._last_result is self._results[0]]
+        for data_key, map_key, _ in _DEVICE_HANDLERS.values():
+            result[data_key].clear()
+            if map_key is not None:
+                result[map_key].clear()
 
         for device in updates["cycle"]["device_status"]:
-            state = device["status1"]
-            if device["type"] == "device_type.door_lock":
-                lock_status_str = device["minigw_lock_status"]
-                lock_status = int(str(lock_status_str or 0), 16)
-                closed = (lock_status & 16) == 16
-                locked = (lock_status & 1) == 1
-                if not lock_status and "device_status.lock" in state:
-                    device["_state"] = "locked"
-                    device["_state2"] = "unknown"
-                    locks.append(device)
-                    continue
-                if not lock_status and "device_status.unlock" in state:
-                    device["_state"] = "unlocked"
-                    device["_state2"] = "unknown"
-                    locks.append(device)
-                    continue
-                if (
-                    lock_status
-                    and (
-                        "device_status.lock" in state or "device_status.unlock" in state
-                    )
-                    and closed
-                    and locked
-                ):
-                    device["_state"] = "locked"
-                    device["_state2"] = "closed"
-                    locks.append(device)
-                    continue
-                if (
-                    lock_status
-                    and (
-                        "device_status.lock" in state or "device_status.unlock" in state
-                    )
-                    and closed
-                    and not locked
-                ):
-                    device["_state"] = "unlocked"
-                    device["_state2"] = "closed"
-                    locks.append(device)
-                    continue
-                if (
-                    lock_status
-                    and (
-                        "device_status.lock" in state or "device_status.unlock" in state
-                    )
-                    and not closed
-                ):
-                    device["_state"] = "unlocked"
-                    device["_state2"] = "open"
-                    locks.append(device)
-                    continue
-                device["_state"] = "unavailable"
-                locks.append(device)
-                continue
-            if device["type"] == "device_type.door_contact":
-                if "device_status.dc_close" in state:
-                    device["_state"] = "closed"
-                    door_windows.append(device)
-                    continue
-                if "device_status.dc_open" in state:
-                    device["_state"] = "open"
-                    door_windows.append(device)
-                    continue
-                device["_state"] = "unavailable"
-                door_windows.append(device)
+            # Interned types make the dispatch and history lookups identity compares.
+            device["type"] = sys.intern(device["type"])
+            handler = _DEVICE_HANDLERS.get(device["type"])
+            if handler is None:
                 continue
-            if device["type"] == "device_type.temperature_sensor":
-                state = device["status_temp"]
-                device["_state"] = float(state)
-                sensors_temperature.append(device)
-                continue
-            if device["type"] == "device_type.smoke_detector":
-                if self.device_on_in_updates_history(
-                    device,
-                    updates,
-                    YALE_EVENT_TYPE_SMOKE_ON,
-                    YALE_EVENT_TYPE_SMOKE_OFF,
-                    minutes=3
-                ):
-                    state = "on"
+            data_key, map_key, handle = handler
+            result[data_key].append(device)
+            if handle is not None:
+                address = device["address"]
+                inputs = (
+                    device["type"],
+                    device["status1"],
+                    device.get("minigw_lock_status"),
+                    device.get("status_temp"),
+                )
+                cached = self._device_cache.get(address)
+                if cached is not None and cached[0] == inputs:
+                    device.update(cached[1])
                 else:
-                    state = "off"
-                device["_state"] = state
-                sensors_smoke.append(device)
-                continue
+                    handle(device)
+                    self._device_cache[address] = (
+                        inputs,
+                        {key: device[key] for key in _STATE_KEYS if key in device},
+                    )
+                result[map_key][address] = device["_state"]
+                index = self.state_index.get(address)
+                if index is None:
+                    index = self.state_index[address] = len(self.states)
+                    self.states.append(None)
+                self.states[index] = device["_state"]
 
-        _door_sensor_map = {
-            contact["address"]: contact["_state"] for contact in door_windows
-        }
-        _lock_map = {lock["address"]: lock["_state"] for lock in locks}
-        _temperature_map = {s["address"]: s["_state"] for s in sensors_temperature}
-        _smoke_map = {s["address"]: s["_state"] for s in sensors_smoke}
+        result["alarm"] = updates["arm_status"]
+        result["status"] = updates["status"]
+        result["online"] = updates["online"]
+        self._last_result = result
+        return result
 
-        return {
-            "alarm": updates["arm_status"],
-            "locks": locks,
-            "door_windows": door_windows,
-            "temperature_sensors": sensors_temperature,
-            "smoke_sensors": sensors_smoke,
-            "status": updates["status"],
-            "online": updates["online"],
-            "door_sensor_map": _door_sensor_map,
-            "lock_map": _lock_map,
-            "temperature_map": _temperature_map,
-            "smoke_map": _smoke_map,
-            "panel_info": updates["panel_info"],
-        }
+    def create_client(self) -> None:
+        """Create the Yale client, authorizing against the API."""
+        try:
+            self.yale = YaleSessionClient(
+                self.entry.data[CONF_USERNAME], self.entry.data[CONF_PASSWORD]
+            )
+        except AuthenticationError as error:
+            raise ConfigEntryAuthFailed from error
+        except YALE_BASE_ERRORS as error:
+            raise UpdateFailed from error
 
-    def get_updates(self) -> dict[str, Any]:
-        """Fetch data from Yale."""
+    async def async_close_client(self) -> None:
+        """Close the Yale client session, if a client was created."""
+        if self.yale is not None:
+            await self.hass.async_add_executor_job(self.yale.close)
+            self.yale = None
+            self.api = None
 
+    async def async_get_api(self) -> YaleAsyncReader:
+        """Return the async API reader, creating the client if needed."""
         if self.yale is None:
-            try:
-                self.yale = YaleSmartAlarmClient(
-                    self.entry.data[CONF_USERNAME], self.entry.data[CONF_PASSWORD]
-                )
-            except AuthenticationError as error:
-                raise ConfigEntryAuthFailed from error
-            except YALE_BASE_ERRORS as error:
-                raise UpdateFailed from error
+            await self.hass.async_add_executor_job(self.create_client)
+        if self.api is None:
+            assert self.yale
+            self.api = YaleAsyncReader(
+                self.hass, async_get_clientsession(self.hass), self.yale.auth
+            )
+        return self.api
+
+    async def async_get_panel_info(self) -> dict[str, Any]:
+        """Fetch the panel info from Yale."""
+        api = await self.async_get_api()
+
+        try:
+            return await api.async_get(ENDPOINT_PANEL_INFO)
+        except AuthenticationError as error:
+            raise ConfigEntryAuthFailed from error
+        except YALE_BASE_ERRORS as error:
+            raise UpdateFailed from error
+
+    async def async_get_updates(self) -> dict[str, Any]:
+        """Fetch data from Yale."""
+
+        api = await self.async_get_api()
 
         try:
-            arm_status = self.yale.get_armed_status()
-            data = self.yale.get_all()
-            cycle = data["CYCLE"]
-            history = data["HISTORY"]
-            status = data["STATUS"]
-            online = data["ONLINE"]
-            panel_info = data["PANEL INFO"]
-            token_time = data["AUTH CHECK"]["token_time"]
-            update_timestamp = datetime.strptime(token_time, "%Y-%m-%d %H:%M:%S")
+            mode, cycle, status, online = await asyncio.gather(
+                api.async_get(ENDPOINT_MODE),
+                api.async_get(ENDPOINT_CYCLE),
+                api.async_get(ENDPOINT_STATUS),
+                api.async_get(ENDPOINT_ONLINE),
+            )
+            arm_status = mode[0]["mode"]
 
         except AuthenticationError as error:
             raise ConfigEntryAuthFailed from error
@@ -211,7 +318,75 @@ class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "cycle": cycle,
             "status": status,
             "online": online,
-            "panel_info": panel_info,
+        }
+
+
+class YaleHistoryCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """A Yale Data Update Coordinator for history driven smoke detector states."""
+
+    def __init__(
+        self, hass: HomeAssistant, device_coordinator: YaleDataUpdateCoordinator
+    ) -> None:
+        """Initialize the Yale history coordinator."""
+        self.entry = device_coordinator.entry
+        self.device_coordinator = device_coordinator
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"{DOMAIN}_history",
+            # Follow the configured interval, but never fall behind the window in
+            # which a smoke event is still counted.
+            update_interval=min(device_coordinator.update_interval, _HIST_WINDOW),
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch history from Yale and set smoke detector states."""
+
+        updates = await self.async_get_updates()
+
+        hist_by_key: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for hist_item in updates["history"]:
+            hist_item["_t"] = _to_seconds(_parse_history_time(hist_item["time"]))
+            hist_item["event_type"] = str(hist_item["event_type"])
+            hist_by_key.setdefault(
+                (sys.intern(hist_item["type"]), str(hist_item["area"])), []
+            ).append(hist_item)
+
+        accepted_t = _to_seconds(updates["update_timestamp"] - _HIST_WINDOW)
+        _smoke_map = {}
+        for device in self.device_coordinator.data["smoke_sensors"]:
+            if _device_on_in_updates_history(
+                device,
+                hist_by_key,
+                accepted_t,
+                YALE_EVENT_TYPE_SMOKE_ON,
+                YALE_EVENT_TYPE_SMOKE_OFF,
+            ):
+                _smoke_map[device["address"]] = "on"
+            else:
+                _smoke_map[device["address"]] = "off"
+
+        return {"smoke_map": _smoke_map}
+
+    async def async_get_updates(self) -> dict[str, Any]:
+        """Fetch history from Yale."""
+        api = await self.device_coordinator.async_get_api()
+
+        try:
+            history, auth_check = await asyncio.gather(
+                api.async_get(ENDPOINT_HISTORY),
+                api.async_get(ENDPOINT_CHECK),
+            )
+            token_time = auth_check["token_time"]
+            update_timestamp = datetime.fromisoformat(token_time)
+
+        except AuthenticationError as error:
+            raise ConfigEntryAuthFailed from error
+        except YALE_BASE_ERRORS as error:
+            raise UpdateFailed from error
+
+        return {
             "history": history,
             "update_timestamp": update_timestamp,
         }
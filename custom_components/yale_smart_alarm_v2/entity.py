@@ -6,7 +6,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER, MODEL
-from .coordinator import YaleDataUpdateCoordinator
+from .coordinator import YaleDataUpdateCoordinator, YaleHistoryCoordinator
 
 
 class YaleEntity(CoordinatorEntity[YaleDataUpdateCoordinator], Entity):
@@ -14,7 +14,11 @@ class YaleEntity(CoordinatorEntity[YaleDataUpdateCoordinator], Entity):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: YaleDataUpdateCoordinator, data: dict) -> None:
+    def __init__(
+        self,
+        coordinator: YaleDataUpdateCoordinator | YaleHistoryCoordinator,
+        data: dict,
+    ) -> None:
         """Initialize an Yale device."""
         super().__init__(coordinator)
         self._attr_unique_id: str = data["address"]
@@ -32,10 +36,11 @@ class YaleAlarmEntity(CoordinatorEntity[YaleDataUpdateCoordinator], Entity):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: YaleDataUpdateCoordinator) -> None:
+    def __init__(
+        self, coordinator: YaleDataUpdateCoordinator, panel_info: dict
+    ) -> None:
         """Initialize an Yale device."""
         super().__init__(coordinator)
-        panel_info = coordinator.data["panel_info"]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.entry.data[CONF_USERNAME])},
             manufacturer=MANUFACTURER,
@@ -49,6 +49,7 @@ class YaleDoorlock(YaleEntity, LockEntity):
         super().__init__(coordinator, data)
         self._attr_code_format = rf"^\d{{{code_format}}}$"
         self.lock_name: str = data["name"]
+        self._state_index = coordinator.state_index[self._attr_unique_id]
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Send unlock command."""
@@ -90,6 +91,7 @@ class YaleDoorlock(YaleEntity, LockEntity):
 
         if lock_state:
             self.coordinator.data["lock_map"][self._attr_unique_id] = command
+            self.coordinator.states[self._state_index] = command
             self.async_write_ha_state()
             return
         raise HomeAssistantError(
@@ -101,4 +103,4 @@ class YaleDoorlock(YaleEntity, LockEntity):
     @property
     def is_locked(self) -> bool | None:
         """Return true if the lock is locked."""
-        return bool(self.coordinator.data["lock_map"][self._attr_unique_id] == "locked")
+        return bool(self.coordinator.states[self._state_index] == "locked")
@@ -8,7 +8,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import COORDINATOR, DOMAIN
@@ -39,7 +39,14 @@ class YaleTemperatureSensor(YaleEntity, SensorEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
-    @property
-    def state(self) -> float:
-        """Return the temperature as a float."""
-        return float(self.coordinator.data["temperature_map"][self._attr_unique_id])
+    def __init__(self, coordinator: YaleDataUpdateCoordinator, data: dict) -> None:
+        """Initialize the Yale Temperature sensor."""
+        super().__init__(coordinator, data)
+        self._state_index = coordinator.state_index[self._attr_unique_id]
+        self._attr_native_value = coordinator.states[self._state_index]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self.coordinator.states[self._state_index]
+        super()._handle_coordinator_update()